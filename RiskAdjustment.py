@@ -1,6 +1,153 @@
+import concurrent.futures
+import functools
+import multiprocessing
+import numpy as np
 import pandas as pd
 import os as os
-from itertools import product
+import re
+
+# Numba and polars are optional accelerators: without numba the hierarchy step
+# falls back to packed bitwise ops, and without polars the crosswalk csvs are read
+# with pandas.
+try:
+    import numba
+except ImportError:
+    numba = None
+
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+# Precompiled patterns for parsing the raw SAS scripts. v22 files share the v21
+# format, so the v21 patterns cover both. The zeros patterns anchor on a literal
+# prefix and use non-capturing repetition instead of lookbehind plus nested
+# captures, which keeps the scan linear with no backtracking.
+_V12_CONDITION = re.compile(r'cc(<?[0-9]*)')
+_V12_ZEROS = re.compile(r'i=([\d]{1,3}(?:,\s?[\d]{1,3})*)')
+_V21_CONDITION = re.compile(r'CC=(<?[0-9]*)')
+_V21_ZEROS = re.compile(r'%STR\(([\d]{1,3}(?:\s?,\s?[\d]{1,3})*)')
+_CC_NUMBER = re.compile(r'\s?HCC([\d]{1,3})')
+_V12_LABEL = re.compile(r'\'(.+?)\s?\'')
+_V21_LABEL = re.compile(r'\"(.+?)\"')
+_ICD_CC = re.compile(r'^(\S+)\s+(\S+)')
+
+if numba is not None:
+    @numba.njit(parallel=True, cache=True)
+    def _apply_hierarchy(flags, cond_idx, zero_idx):
+        """ Return a copy of the boolean recipient x CC matrix with every rule
+        applied: wherever the condition CC is set, the corresponding CC to zero is
+        cleared. All conditions are evaluated against the incoming flags, and each
+        recipient row stays in cache across the whole rule sweep.
+        """
+        out = flags.copy()
+        for r in numba.prange(flags.shape[0]):
+            for k in range(cond_idx.size):
+                if flags[r, cond_idx[k]]:
+                    out[r, zero_idx[k]] = False
+        return out
+
+
+def _apply_hierarchy_bitset(flags, cond_idx, zero_idx):
+    """ Pure-NumPy hierarchy application over uint64 bitsets.
+
+    Packs the boolean recipient x CC matrix to one bit per CC, then applies each
+    rule with a shift/mask over the packed words: the condition bit, read from a
+    snapshot of the original flags, clears the to-zero bit. 64x denser than the
+    boolean matrix and every operation is a vectorized bitwise op.
+    """
+    n_cc = flags.shape[1]
+    packed = np.packbits(flags, axis=1, bitorder='little')
+
+    # Pad the byte columns to a multiple of 8 so they view cleanly as uint64.
+    n_words = -(-n_cc // 64)
+    pad = n_words * 8 - packed.shape[1]
+    if pad:
+        packed = np.hstack([packed, np.zeros((packed.shape[0], pad), dtype=np.uint8)])
+    bits = np.ascontiguousarray(packed).view(np.uint64)
+
+    original = bits.copy()
+    for a, b in zip(cond_idx, zero_idx):
+        cond = (original[:, a // 64] >> np.uint64(a % 64)) & np.uint64(1)
+        bits[:, b // 64] &= ~(cond << np.uint64(b % 64))
+
+    unpacked = np.unpackbits(bits.view(np.uint8), axis=1, bitorder='little')
+    return unpacked[:, :n_cc].astype(bool)
+
+
+def _read_reference_table(stem):
+    """ Read a reference table saved by the extract helpers, preferring the typed
+    Parquet form and falling back to the legacy csv.
+    """
+    if os.path.exists(stem + '.parquet'):
+        return pd.read_parquet(stem + '.parquet')
+    return pd.read_csv(stem + '.csv')
+
+
+def _build_combined_crosswalk(version):
+    """ Combine every crosswalk csv for a CC version into one Parquet file.
+
+    Reading a single columnar file is much faster than re-parsing the individual
+    csvs on every generate_hccs call. The combined file is written alongside the
+    csvs as Crosswalks/_combined_{version}.parquet and rebuilt only when missing;
+    delete it to pick up regenerated crosswalks. Returns the file path.
+    """
+    path = 'Crosswalks/_combined_' + version + '.parquet'
+    if not os.path.exists(path):
+        # Crosswalks regenerated by format_crosswaks are Parquet; the shipped
+        # legacy files are csv. Prefer the Parquet form when a crosswalk exists in
+        # both formats (csv sorts first, so the parquet name wins).
+        sources = {}
+        for file in sorted(os.listdir('Crosswalks')):
+            if (version in file and not file.startswith('_combined')
+                    and file.endswith(('.csv', '.parquet'))):
+                sources[os.path.splitext(file)[0]] = 'Crosswalks/' + file
+
+        # Polars' multithreaded csv reader loads the batch considerably faster;
+        # pin the schema so all-numeric icd codes keep their leading zeros.
+        if pl is not None:
+            schema = {'icd': pl.String, 'cc': pl.Int64, 'version': pl.Int64,
+                      'year': pl.Int64}
+            # The shipped csvs differ in column order, so align by name.
+            df_map = (pl.concat([pl.scan_parquet(path) if path.endswith('.parquet')
+                                 else pl.scan_csv(path, schema_overrides=schema)
+                                 for path in sources.values()], how='diagonal')
+                        .collect().to_pandas())
+        else:
+            df_map = pd.concat([pd.read_parquet(path) if path.endswith('.parquet')
+                                else pd.read_csv(path, dtype={'icd': str})
+                                for path in sources.values()],
+                               ignore_index=True)
+
+        # The claims input calls the diagnosis code diag_code, so align the
+        # crosswalks with that name here. Compact dtypes keep the file small and
+        # make the merge keys cheap to hash.
+        df_map = df_map.rename(columns={'icd': 'diag_code'})
+        df_map['diag_code'] = df_map['diag_code'].astype('category')
+        df_map['version'] = df_map['version'].astype('int8')
+        df_map['year'] = df_map['year'].astype('int16')
+        df_map.to_parquet(path, compression='zstd', index=False)
+    return path
+
+
+@functools.lru_cache(maxsize=8)
+def _load_references(version):
+    """ Load the reference data for a CC version, cached across calls.
+
+    Returns (df_map, cc_index, cond_idx, zero_idx): the combined crosswalk, the
+    canonical CC order, and the hierarchy rules already resolved to positions in
+    that order. Repeated generate_hccs calls for the same version reuse the parsed
+    tables, so treat the returned objects as read-only.
+    """
+    df_map = pd.read_parquet(_build_combined_crosswalk(version))
+    df_hier = _read_reference_table('ConditionCategory/' + version + '_rules')
+    df_list = _read_reference_table('ConditionCategory/' + version + '_labels')
+
+    cc_index = pd.Index(df_list.cc)
+    cond_idx = cc_index.get_indexer(df_hier.cc)
+    zero_idx = cc_index.get_indexer(df_hier.to_zero)
+    return df_map, cc_index, cond_idx, zero_idx
+
 
 def generate_hccs(df, version):
     """ Generate Hierarchical Condition Codes (HCCs) for unique recipients from a dataframe of 
@@ -19,39 +166,100 @@ def generate_hccs(df, version):
       pandas.DataFrame with one row per unique recipient and one column per HCC. All DataFrame
         values are True or False for whether that HCC applies to the recipient.
     """
-    # Determine the necessary crosswalks, hierarchy and CC list based on the version
-    crosswalk_list = [file for file in os.listdir('Crosswalks') if version in file]
-    hierarchy = 'ConditionCategory/'+version+'_rules.csv'
-    cc_list = 'ConditionCategory/'+version+'_labels.csv'
-
-    # Create icd to cc mapping DataFrame, and read in the rules and list DataFrames.
-    lst = []
-    for file in crosswalk_list:
-        lst.append(pd.read_csv('Crosswalks/'+file))
-    df_map = pd.concat(lst)
-    df_hier = pd.read_csv(hierarchy)
-    df_list = pd.read_csv(cc_list)
-
-    # Bring CCs to the input DataFrame based on diagnosis codes.
-    # Drop all helper columns that are no longer useful after the merge.
-    df['year'] = df['claim_date'].dt.year
-
-    merged = (df.merge(df_map, on=['diag_code', 'year', 'version'], how='left')
-                .drop(columns=['claim_date', 'year']))
-    
-    # Keep only the subset that was mapped to a CC.
-    merged = merged[merged.cc.notnull()]
-
-    # Now convert this to a truth table for whether a CC exists for a recipient
-    # Uses the FULL list of CCs as the index.
-    merged = (merged.groupby(['recip_id', 'cc'])
-                    .size().unstack(fill_value=0)
-                    .reindex(df_list.cc, axis=1, fill_value=0).astype(bool))
-
-    # Apply heirarchies. For hierarchical codes, if the column in merged is True, 
-    # set the appropriate other column to False. 
-    for index, row in df_hier.iterrows():
-        merged.loc[merged[row.cc] == True, row.to_zero] = False
+    # The references are cached, so only the first call per version pays the
+    # parsing cost.
+    return _process_chunk(df, _load_references(version))
+
+
+def generate_hccs_batch(chunks, version, workers=None):
+    """ Generate HCC truth tables for an iterable of claim DataFrames.
+
+    Loads the reference data for the version once and yields one truth table per
+    chunk, in input order. Use this when processing many cohorts or date windows:
+    the reference load is amortized across all chunks, and with workers the chunks
+    are spread over a process pool.
+
+    Args:
+      chunks: iterable of pandas.DataFrame
+        Each chunk is formatted like the generate_hccs input. Keep all rows for a
+        recipient within one chunk, otherwise that recipient appears in several of
+        the yielded tables.
+      version: string {'v12', 'v21', 'v22'}
+        Determines which version of CC codes and hierarchies to use.
+      workers: int, optional
+        Number of worker processes. The default processes the chunks serially in
+        this process.
+
+    Yields:
+      One truth-table DataFrame per chunk, as returned by generate_hccs.
+    """
+    # Warm the reference cache (and the combined crosswalk file) before any
+    # workers fork, so they all read the prebuilt Parquet instead of racing to
+    # create it.
+    refs = _load_references(version)
+
+    if workers is None or workers == 1:
+        for chunk in chunks:
+            yield _process_chunk(chunk, refs)
+    else:
+        # Spawned workers sidestep the fork-safety problems of the polars/numba
+        # thread runtimes that may already be live in this process.
+        with concurrent.futures.ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context('spawn')) as pool:
+            yield from pool.map(functools.partial(generate_hccs, version=version),
+                                chunks)
+
+
+def _process_chunk(df, refs):
+    """ Compute the truth table for one chunk of claims given the preloaded
+    references from _load_references.
+    """
+    df_map, cc_index, cond_idx, zero_idx = refs
+
+    # Bring CCs to the input DataFrame based on diagnosis codes. Build the merge
+    # keys on a local frame with assign so the caller's DataFrame is not mutated,
+    # projecting down to the columns the merge actually needs so claim_date is not
+    # copied through the merge output just to be dropped again.
+    # Cast the keys to the crosswalk's compact dtypes while at it: comparing
+    # categorical codes and small ints hashes far cheaper than raw strings. Codes
+    # outside the crosswalk become NaN here and drop out after the merge anyway.
+    left = df[['recip_id']].assign(
+        diag_code=pd.Categorical(df['diag_code'],
+                                 categories=df_map['diag_code'].cat.categories),
+        version=df['version'].astype('int8'),
+        year=df['claim_date'].dt.year.astype('int16'))
+
+    # An inner join keeps only the rows that mapped to a CC, so cc arrives as the
+    # crosswalk's own integer dtype instead of being upcast to float by the missing
+    # rows of a left join and filtered/cast back afterwards. The truth table below
+    # needs just the recipient and CC.
+    merged = left.merge(df_map, on=['diag_code', 'year', 'version'],
+                        how='inner')[['recip_id', 'cc']]
+
+    # Now convert this to a truth table for whether a CC exists for a recipient.
+    # Uses the FULL list of CCs as the columns. Factorizing both keys into positional
+    # codes lets a single fancy-indexed assignment fill the table, instead of the
+    # much heavier groupby/unstack/reindex chain.
+    recip_codes, recip_ids = pd.factorize(merged['recip_id'], sort=True)
+    cc_codes = cc_index.get_indexer(merged['cc'])
+
+    truth_table = np.zeros((len(recip_ids), len(cc_index)), dtype=bool)
+    truth_table[recip_codes, cc_codes] = True
+    merged = pd.DataFrame(truth_table, index=pd.Index(recip_ids, name='recip_id'),
+                          columns=cc_index)
+
+    # Apply heirarchies. For hierarchical codes, if the column in merged is True,
+    # set the appropriate other column to False. With numba the rules run in a
+    # compiled kernel that sweeps each recipient row once; otherwise they run as
+    # vectorized bitwise ops over a packed uint64 bitset of the same table. Both
+    # evaluate every condition against the pre-hierarchy flags.
+    flags = merged.values
+    if numba is not None:
+        flags = _apply_hierarchy(flags, cond_idx, zero_idx)
+    else:
+        flags = _apply_hierarchy_bitset(flags, cond_idx, zero_idx)
+    merged = pd.DataFrame(flags, index=merged.index, columns=merged.columns)
 
     return merged
 
@@ -65,48 +273,50 @@ def extract_hierachy_rules(version_list):
         version_list = ['2010/v12/V12H70H.txt', '2015/v21/V20H87H1.txt', '2017/v22/V22H79H1.txt']
 
     Output:
-      Saves formatted csv to 'ConditionCategory/' with the suffix _rules.csv
+      Saves formatted Parquet to 'ConditionCategory/' with the suffix _rules.parquet
 
     """
     for file in version_list:
         # Determine the version, read in the data.
         _, cc_version, _ = file.split('/')
-        df_logic = pd.read_table('Raw/' + file, header=None).rename(columns={0:'text'})
+        df_logic = (pd.read_table('Raw/' + file, header=None, dtype='string[pyarrow]')
+                      .rename(columns={0:'text'}))
 
         if cc_version == 'v12':
             # Find the logical if statement in the hierarchy.
-            df = pd.DataFrame(df_logic.text.str.split('if h', 1).tolist(), 
+            df = pd.DataFrame(df_logic.text.str.split('if h', n=1).tolist(),
                               columns=['junk', 'logic'])
 
             # Locate the HCC that begins the if statement.
-            df['condition'] = df['logic'].str.extract('cc(<?[0-9]*)', expand=True)
+            df['condition'] = df['logic'].str.extract(_V12_CONDITION, expand=True)
 
             # Find all HCCs to zero based on above 'condition' HCC.
-            df['zeros'] = df['logic'].str.extract('(?<=i=)([\d]{1,3}(,\s?[\d]{1,3})*)', 
-                                                  expand=True)[0]
+            df['zeros'] = df['logic'].str.extract(_V12_ZEROS, expand=True)[0]
 
         elif cc_version == 'v21' or cc_version == 'v22':
             # Find the logical if statement in the hierarchy.
-            df = pd.DataFrame(df_logic.text.str.split(r'%SET0\(', 1).tolist(), 
+            df = pd.DataFrame(df_logic.text.str.split(r'%SET0\(', n=1).tolist(),
                               columns=['junk', 'logic'])
 
             # Locate the HCC that begins the if statement.
-            df['condition'] = df['logic'].str.extract('CC=(<?[0-9]*)', expand=True)
+            df['condition'] = df['logic'].str.extract(_V21_CONDITION, expand=True)
 
             # Find all HCCs to zero based on above 'condition' HCC.
-            df['zeros'] = df['logic'].str.extract('(?<=%STR\()([\d]{1,3}(\s?,\s?[\d]{1,3})*)', 
-                                                  expand=True)[0]
+            df['zeros'] = df['logic'].str.extract(_V21_ZEROS, expand=True)[0]
 
         # Eplode the above list to a long DataFrame named rules. Rules contains one row per HCC we
         # need to zero.
         smalldf = df.loc[(df.condition.notnull()) & (df.zeros.notnull()), ['zeros', 'condition']]
-        rules = (pd.concat([pd.Series(row['condition'], row['zeros'].split(',')) 
-                           for _, row in  smalldf.iterrows()])
-                   .reset_index()
-                   .rename(columns={'index': 'to_zero', 0:'cc'}))
+        rules = (smalldf.assign(to_zero=smalldf['zeros'].str.split(','))
+                        .explode('to_zero')
+                        .rename(columns={'condition': 'cc'})[['to_zero', 'cc']])
+        rules['to_zero'] = rules['to_zero'].str.strip()
 
-        # Save exploded list so we can use that in the future. 
-        rules.to_csv('ConditionCategory/' + cc_version+'_rules.csv', sep=',', index=False)
+        # Save exploded list so we can use that in the future, with both columns as
+        # proper integers so no type inference is needed on read.
+        rules = rules.astype({'to_zero': 'int64', 'cc': 'int64'})
+        rules.to_parquet('ConditionCategory/' + cc_version+'_rules.parquet',
+                         compression='zstd', index=False)
 
 
 def extract_cc_table(version_list):
@@ -118,31 +328,54 @@ def extract_cc_table(version_list):
         version_list =  ['2010/v12/V12H70L.txt','2015/v21/V20H87L1.txt','2017/v22/V22H79L1.txt']
 
     Output:
-      Saves formatted csv to 'ConditionCategory/' with the suffix _rules.csv
+      Saves formatted Parquet to 'ConditionCategory/' with the suffix _labels.parquet
 
     """
     for file in version_list:
         _, cc_version, _ = file.split('/')
 
-        df = pd.read_table('Raw/'+file, header=None).rename(columns={0:'text'})
+        df = (pd.read_table('Raw/'+file, header=None, dtype='string[pyarrow]')
+                .rename(columns={0:'text'}))
 
         # Extract the CC number.
-        df['cc'] = df['text'].str.extract('\s?HCC([\d]{1,3})', expand=True)[0]
+        df['cc'] = df['text'].str.extract(_CC_NUMBER, expand=True)[0]
 
         #Extract the label
         if cc_version == 'v12':
-            df['label'] = df['text'].str.extract('\'(.+?)\s?\'', expand=True)[0]
+            df['label'] = df['text'].str.extract(_V12_LABEL, expand=True)[0]
         elif cc_version == 'v21' or cc_version == 'v22':
             # Extract the label.
-            df['label'] = df['text'].str.extract('\"(.+?)\"', expand=True)[0]
+            df['label'] = df['text'].str.extract(_V21_LABEL, expand=True)[0]
 
         #Save only the subset of rows and columns that atually correspond to a cc and label.
         (df.loc[df.cc.notnull() & df.label.notnull(), ['cc', 'label']]
-           .to_csv('ConditionCategory/' + cc_version+'_labels.csv', sep=',', index=False))
+           .astype({'cc': 'int64', 'label': 'str'})
+           .to_parquet('ConditionCategory/' + cc_version+'_labels.parquet',
+                       compression='zstd', index=False))
+
+
+def _parse_icd_table(path, version, year):
+    """ Read a raw icd mapping file and return a DataFrame with icd, cc, version and
+    year columns. The raw data is horribly formatted, so a single str.extract pass
+    pulls the icd and cc fields out of the whitespace-separated text at once.
+    """
+    df = pd.read_table(path, header=None, dtype='string[pyarrow]')
+    df[['icd', 'cc']] = df[0].str.extract(_ICD_CC, expand=True)
+
+    # Make the cc column properly integer rather than leaving it to the reader's
+    # type inference.
+    df['cc'] = df['cc'].astype('int64')
+
+    # Add information on the version and year.
+    df['version'] = version
+    df['year'] = year
+
+    # No longer need this column
+    return df.drop(columns=0)
 
 
 def format_crosswaks(icd9_list=None, icd10_list=None):
-    """ Formats crosswalks into an easily readable csv with additional information about
+    """ Formats crosswalks into typed Parquet files with additional information about
     icd version and year. 
 
     ***If additional mappings are needed outside of 2009-2017, make sure any
@@ -164,7 +397,7 @@ def format_crosswaks(icd9_list=None, icd10_list=None):
               '2017/v21/F2117H1R.txt', '2017/v22/F2217O1P.txt']
 
     Output: 
-      Saves formatted csv to "Crosswalks/"
+      Saves formatted Parquet to "Crosswalks/"
       
     """
     if icd9_list is None:
@@ -174,64 +407,50 @@ def format_crosswaks(icd9_list=None, icd10_list=None):
 
     # Clean all icd9 crosswalks.
     for file in icd9_list:
-        # Input data is horribly formatted, so this works to resolve columns with dangling Ds.
         year, cc_version, name = file.split('/')
-
-        df = pd.read_table('Raw/'+file, header=None)
-        df['icd'] = [item[0] for item in df[0].str.split('\s+')]
-        df['cc'] = [item[1] for item in df[0].str.split('\s+')]
-        
-        # Add information on the version and year.
-        df['version'] = 9
-        df['year'] = int(year)
-
-        # No longer need this column
-        df = df.drop(columns=0)
+        df = _parse_icd_table('Raw/'+file, version=9, year=int(year))
 
         # Need to manually append the additional CC mappings found in the VXXXXXM files.
+        # Collect every piece in a list and concatenate once, rather than re-copying
+        # the whole DataFrame with chained appends.
+        extras = [df]
         if cc_version == 'v12':
-            dictionary1 = {'year': [int(year)], 
-                           'icd': ['40403', '40413', '40493'], 
-                           'version': [9], 
-                           'cc': [80]}
-            df_extra = pd.DataFrame([row for row in product(*dictionary1.values())], 
-                                    columns=dictionary1.keys())
+            extras.append(pd.DataFrame({'year': int(year),
+                                        'icd': ['40403', '40413', '40493'],
+                                        'version': 9,
+                                        'cc': 80}))
 
         elif cc_version == 'v21' and int(year) <= 2015:
-            dictionary2 = {'year': [int(year)],
-                           'icd': ['3572', '36202'], 
-                           'version': [9], 
-                           'cc': [18]}
-            dictionary3 = {'year': [int(year)],
-                           'icd': ['40401', '40403', '40411', '40413', '40491', '40493'],
-                           'version': [9], 
-                           'cc': [85]}
-            df_extra = pd.DataFrame([row for row in product(*dictionary2.values())], 
-                                    columns=dictionary2.keys())
-            df_extra = df_extra.append(pd.DataFrame([row for row in product(*dictionary3.values())], 
-                                                    columns=dictionary3.keys()))
+            extras.append(pd.DataFrame({'year': int(year),
+                                        'icd': ['3572', '36202'],
+                                        'version': 9,
+                                        'cc': 18}))
+            extras.append(pd.DataFrame({'year': int(year),
+                                        'icd': ['40401', '40403', '40411', '40413',
+                                                '40491', '40493'],
+                                        'version': 9,
+                                        'cc': 85}))
 
         elif cc_version == 'v22' and int(year) <= 2015:
-            df_extra = pd.DataFrame({'year': [int(year)], 'icd': ['36202'], 'version': [9],
-                                     'cc': [18]})
-            dictionary4 = {'year': [int(year)], 
-                'icd': ['40403', '40413', '40493'], 'version': [9], 'cc': [85]}
-            df_extra = df_extra.append(pd.DataFrame([row for row in product(*dictionary4.values())], 
-                                                    columns=dictionary4.keys()))
+            extras.append(pd.DataFrame({'year': int(year),
+                                        'icd': ['36202'],
+                                        'version': 9,
+                                        'cc': 18}))
+            extras.append(pd.DataFrame({'year': int(year),
+                                        'icd': ['40403', '40413', '40493'],
+                                        'version': 9,
+                                        'cc': 85}))
 
-        df = df.append(df_extra)
+        df = pd.concat(extras, ignore_index=True)
 
         # Save DataFrame so we don't need to re-run this.
-        df.to_csv('Crosswalks/'+year+'_'+cc_version+'_icd9.csv', sep=',', index=False)
+        df.to_parquet('Crosswalks/'+year+'_'+cc_version+'_icd9.parquet',
+                      compression='zstd', index=False)
 
     # Clean up all icd10s in the same manner. ICD 10s have no additional mappings, as they already
     # appear in the raw map files with a 'D' in the row. 
     for file in icd10_list:
         year, cc_version, name = file.split('/')
-        df = pd.read_table('Raw/'+file, header=None)
-        df['icd'] = [item[0] for item in df[0].str.split('\s+')]
-        df['cc'] = [item[1] for item in df[0].str.split('\s+')]
-        df['version'] = 10
-        df['year'] = int(year)
-        df = df.drop(columns=0)
-        df.to_csv('Crosswalks/'+year+'_'+cc_version+'_icd10.csv', sep=',', index=False)
+        df = _parse_icd_table('Raw/'+file, version=10, year=int(year))
+        df.to_parquet('Crosswalks/'+year+'_'+cc_version+'_icd10.parquet',
+                      compression='zstd', index=False)